@@ -13,6 +13,7 @@ import logging
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
 
 def normal_versor(a, b, c):
     """
@@ -72,7 +73,7 @@ def normal_versor_2(vert_list):
     Parameters
     ----------
     vert_list : list of list of floats (polygon)
-        list with n lists of three floats (n vertices)
+        list with n lists of three floats (n vertices), or np.array (n, 3)
  
     Returns
     -------
@@ -82,36 +83,36 @@ def normal_versor_2(vert_list):
 
     # Check input data type
 
-    if not isinstance(vert_list, tuple):
+    if isinstance(vert_list, np.ndarray):
+        if vert_list.ndim != 2 or vert_list.shape[1] != 3:
+            raise TypeError(
+                f"ERROR normal_versor_2 function, the input is not an array of vertices (n, 3): input {vert_list}"
+            )
+    elif not isinstance(vert_list, tuple):
         raise TypeError(
             f"ERROR normal_versor_2 function, the input is not a list: input {vert_list}"
         )
-    # if len(vert_list) > 3:
-    # wrn(f"normalAlternative function, there vertlist should be 3 components long: vertList {vertList}")
-
-    for vtx in vert_list:
-        if not isinstance(vtx, tuple):
-            raise TypeError(
-                f"ERROR normalAlternative function, an input is not a list: input {vtx}"
-            )
-        if len(vtx) != 3:
-            raise TypeError(
-                f"ERROR normalAlternative function, a vertex is not a list of 3 components: input {vtx}"
-            )
-        try:
-            float(vtx[0])
-            float(vtx[1])
-            float(vtx[2])
-        except ValueError:
-            raise ValueError(
-                f"ERROR normalAlternative function, a coordinate is not a float: input {vtx}"
-            )
-    c = centroid(vert_list)
-    crossProd = np.array([0.0, 0, 0])
-    for i in range(len(vert_list)):
-        a = np.array(vert_list[i - 1]) - c
-        b = np.array(vert_list[i]) - c
-        crossProd += np.cross(a, b)
+    else:
+        for vtx in vert_list:
+            if not isinstance(vtx, tuple):
+                raise TypeError(
+                    f"ERROR normalAlternative function, an input is not a list: input {vtx}"
+                )
+            if len(vtx) != 3:
+                raise TypeError(
+                    f"ERROR normalAlternative function, a vertex is not a list of 3 components: input {vtx}"
+                )
+            try:
+                float(vtx[0])
+                float(vtx[1])
+                float(vtx[2])
+            except ValueError:
+                raise ValueError(
+                    f"ERROR normalAlternative function, a coordinate is not a float: input {vtx}"
+                )
+    # Sum of the cross products of consecutive vertices (relative to the centroid)
+    rel = np.asarray(vert_list, dtype=float) - centroid(vert_list)
+    crossProd = np.cross(np.roll(rel, 1, axis=0), rel).sum(axis=0)
     return crossProd / np.linalg.norm(crossProd)
 
 
@@ -125,7 +126,7 @@ def polygon_area(poly):
     Parameters
     ----------
     poly : list of list of floats (polygon)
-        list with three floats with the coordinates of the first point
+        list with three floats with the coordinates of the first point, or np.array (n, 3)
  
     Returns
     -------
@@ -135,44 +136,43 @@ def polygon_area(poly):
 
     # Check input data type
 
-    if not isinstance(poly, tuple):
+    if isinstance(poly, np.ndarray):
+        if poly.ndim != 2 or poly.shape[1] != 3:
+            raise TypeError(
+                f"ERROR polygon_area function, the input is not an array of vertices (n, 3): input {poly}"
+            )
+    elif not isinstance(poly, tuple):
         raise TypeError(
             f"ERROR polygon_area function, the input is not a list: input {poly}"
         )
-    for vtx in poly:
-        if not isinstance(vtx, list) and not isinstance(vtx, tuple):
-            raise TypeError(
-                f"ERROR polygon_area function, an input is not a list: input {vtx}"
-            )
-        if len(vtx) != 3:
-            raise TypeError(
-                f"ERROR polygon_area function, a vertex is not a list of 3 components: input {vtx}"
-            )
-        try:
-            vtx = list(vtx)
-            vtx[0] = float(vtx[0])
-            vtx[1] = float(vtx[1])
-            vtx[2] = float(vtx[2])
-        except ValueError:
-            raise ValueError(
-                f"ERROR unit_normal function, a coordinate is not a float: input {vtx}"
-            )
+    else:
+        for vtx in poly:
+            if not isinstance(vtx, list) and not isinstance(vtx, tuple):
+                raise TypeError(
+                    f"ERROR polygon_area function, an input is not a list: input {vtx}"
+                )
+            if len(vtx) != 3:
+                raise TypeError(
+                    f"ERROR polygon_area function, a vertex is not a list of 3 components: input {vtx}"
+                )
+            try:
+                vtx = list(vtx)
+                vtx[0] = float(vtx[0])
+                vtx[1] = float(vtx[1])
+                vtx[2] = float(vtx[2])
+            except ValueError:
+                raise ValueError(
+                    f"ERROR unit_normal function, a coordinate is not a float: input {vtx}"
+                )
     # area of polygon poly
 
     if len(poly) < 3:  # Not a plane - no area
-        logging.error("WARNING number of vertices lower than 3, the area will be zero")
+        logger.error("WARNING number of vertices lower than 3, the area will be zero")
         return 0
-    total = [0, 0, 0]
-    N = len(poly)
-    for i in range(N):
-        vi1 = poly[i]
-        vi2 = poly[(i + 1) % N]
-        prod = np.cross(vi1, vi2)
-        total[0] += prod[0]
-        total[1] += prod[1]
-        total[2] += prod[2]
-    result = np.dot(total, normal_versor_2((poly[0], poly[1], poly[2])))
-    return float(abs(result / 2))
+    # Module of the Newell normal of the whole polygon (same as normal_versor_2):
+    # the plane of the first three vertices is badly conditioned if they are nearly aligned
+    vertices = np.asarray(poly, dtype=float)
+    return float(polygons_normal_and_area(vertices[np.newaxis])[1][0])
 
 
 # %%
@@ -180,14 +180,18 @@ def polygon_area(poly):
 
 def check_complanarity(vert_list_tot, precision=1):
     """
-    checks the complanarity of a list of points
+    checks the complanarity of a list of points: for every group of 4 consecutive points
+    the fourth one must satisfy the plane equation of the first three, with a residual lower than precision.
+    The plane normal is not normalized: the residual is the distance of the fourth point from the plane
+    multiplied by the area of the parallelogram of the first three points (e.g. for a 10 m x 10 m
+    corner the default precision accepts 1 cm)
     
     Parameters
     ----------
     vert_list_tot : list of list of floats (polygon)
         list with n lists of three floats (n vertices)
     precision: float
-        defines the precision of the control [m]
+        defines the precision of the control, maximum residual of the plane equation [m3]
  
     Returns
     -------
@@ -225,30 +229,68 @@ def check_complanarity(vert_list_tot, precision=1):
             f"ERROR check_complanarity function, precision is not a float: precision {precision}"
         )
     # Look if they are coplanar
+    if len(vert_list_tot) < 4:
+        return True
+    vertices = np.asarray(vert_list_tot, dtype=float)[np.newaxis]
+    return bool(check_complanarity_batch(vertices, precision)[0])
+
+
+# %%
+
+
+def polygons_normal_and_area(verts):
+    """
+    Normal versors and areas of a batch of polygons with the same number of vertices.
+    Vectorized version of normal_versor_2 and polygon_area
+    
+    Parameters
+    ----------
+    verts : np.array
+        array (N polygons, V vertices, 3 coordinates)
+ 
+    Returns
+    -------
+    tuple: np.array of the normal versors (N, 3) and np.array of the areas (N)
+    
+    """
+
+    verts = np.asarray(verts, dtype=float)
+    # Same sum of normal_versor_2, whose module is twice the area of the polygon
+    rel = verts - verts.mean(axis=1, keepdims=True)
+    total = np.cross(np.roll(rel, 1, axis=1), rel).sum(axis=1)
+    norm = np.linalg.norm(total, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normals = total / norm[:, np.newaxis]
+    return normals, norm / 2
+
+
+# %%
+
+
+def check_complanarity_batch(verts, precision=1):
+    """
+    checks the complanarity of a batch of polygons with the same number of vertices.
+    Vectorized version of check_complanarity
+    
+    Parameters
+    ----------
+    verts : np.array
+        array (N polygons, V vertices, 3 coordinates)
+    precision: float
+        defines the precision of the control, maximum residual of the plane equation [m3]
+ 
+    Returns
+    -------
+    np.array: boolean array (N), are they in the same plane? True or False 
+    
+    """
 
-    flag = True
-    for i in range(len(vert_list_tot) - 3):
-        vert_list = vert_list_tot[i: (i + 4)]
-        a1 = vert_list[1][0] - vert_list[0][0]
-        b1 = vert_list[1][1] - vert_list[0][1]
-        c1 = vert_list[1][2] - vert_list[0][2]
-        a2 = vert_list[2][0] - vert_list[0][0]
-        b2 = vert_list[2][1] - vert_list[0][1]
-        c2 = vert_list[2][2] - vert_list[0][2]
-        a = b1 * c2 - b2 * c1
-        b = a2 * c1 - a1 * c2
-        c = a1 * b2 - b1 * a2
-        d = -a * vert_list[0][0] - b * vert_list[0][1] - c * vert_list[0][2]
-
-        # equation of plane is: a*x + b*y + c*z = 0
-        # checking if the 4th point satisfies
-        # the above equation
-        if not (
-                np.abs(a * vert_list[3][0] + b * vert_list[3][1] + c * vert_list[3][2] + d)
-                < precision
-        ):
-            flag = False
-    return flag
+    verts = np.asarray(verts, dtype=float)
+    # Same test of check_complanarity on every group of 4 consecutive vertices
+    origin = verts[:, :-3]
+    normals = np.cross(verts[:, 1:-2] - origin, verts[:, 2:-1] - origin)
+    residuals = np.einsum("nij,nij->ni", normals, verts[:, 3:] - origin)
+    return (np.abs(residuals) < precision).all(axis=1)
 
 
 # %%
@@ -261,7 +303,7 @@ def centroid(vert_list):
     Parameters
     ----------
     vert_list : list of list of floats (polygon)
-        list with n lists of three floats (n vertices)
+        list with n lists of three floats (n vertices), or np.array (n, 3)
  
     Returns
     -------
@@ -271,32 +313,35 @@ def centroid(vert_list):
 
     # Check input data type
 
-    if not isinstance(vert_list, tuple):
+    if isinstance(vert_list, np.ndarray):
+        if vert_list.ndim != 2 or vert_list.shape[1] != 3:
+            raise TypeError(
+                f"ERROR centroid function, the input is not an array of vertices (n, 3): input {vert_list}"
+            )
+    elif not isinstance(vert_list, tuple):
         raise TypeError(
             f"ERROR centroid function, the input is not a list: input {vert_list}"
         )
-    for vtx in vert_list:
-        if not isinstance(vtx, tuple):
-            raise TypeError(
-                f"ERROR centroid function, an input is not a list: input {vtx}"
-            )
-        if len(vtx) != 3:
-            raise TypeError(
-                f"ERROR centroid function, a vertex is not a list of 3 components: input {vtx}"
-            )
-        try:
-            float(vtx[0])
-            float(vtx[1])
-            float(vtx[2])
-        except ValueError:
-            raise ValueError(
-                f"ERROR centroid function, a coordinate is not a float: input {vtx}"
-            )
+    else:
+        for vtx in vert_list:
+            if not isinstance(vtx, tuple):
+                raise TypeError(
+                    f"ERROR centroid function, an input is not a list: input {vtx}"
+                )
+            if len(vtx) != 3:
+                raise TypeError(
+                    f"ERROR centroid function, a vertex is not a list of 3 components: input {vtx}"
+                )
+            try:
+                float(vtx[0])
+                float(vtx[1])
+                float(vtx[2])
+            except ValueError:
+                raise ValueError(
+                    f"ERROR centroid function, a coordinate is not a float: input {vtx}"
+                )
     # Centroid calculation
-    c = np.array([0.0, 0, 0], dtype=float)
-    for i in vert_list:
-        c += np.array(i)
-    return c / len(vert_list)
+    return np.asarray(vert_list, dtype=float).mean(axis=0)
 
 
 # %%
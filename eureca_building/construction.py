@@ -20,6 +20,8 @@ from eureca_building.exceptions import (
 from eureca_building.material import Material, AirGapMaterial
 from eureca_building.units import units
 
+_CONSTRUCTION_TYPES = frozenset(("ExtWall", "Roof", "GroundFloor", "IntWall", "IntCeiling"))
+
 
 # %% OpaqueMaterial class
 
@@ -63,6 +65,33 @@ class Construction(object):
 
     rad_heat_trans_coef = 5.0
 
+    __slots__ = (
+        "name",
+        "construction_type",
+        "materials_list",
+        "_R_si",
+        "_R_se",
+        "_conv_heat_trans_coef_int",
+        "_conv_heat_trans_coef_ext",
+        "ext_absorptance",
+        "number_of_layers",
+        "net_thermal_resistance",
+        "thicknesses",
+        "conductivities",
+        "densities",
+        "spec_heats",
+        "thermal_resistances",
+        "thermal_resistance",
+        "_u_value_net",
+        "_u_value",
+        "k_est",
+        "k_int",
+        "k_mean",
+        "omega_bt",
+        "_A1n_t2",
+        "_A1n_t7",
+    )
+
     def __init__(
             self, name: str, materials_list: list, construction_type: str = "ExtWall"
     ):
@@ -92,13 +121,7 @@ class Construction(object):
                 raise TypeError(
                     f"Construction {name}. materials_list must be a list of Materials or AirGapMaterial objects. Material {mat.name}"
                 )
-        if construction_type not in [
-            "ExtWall",
-            "Roof",
-            "GroundFloor",
-            "IntWall",
-            "IntCeiling",
-        ]:
+        if construction_type not in _CONSTRUCTION_TYPES:
             raise WrongConstructionType(
                 f'Construction {name}. construction type {construction_type} not in ["ExtWall", "Roof", "GroundFloor", "IntWall", "IntCeiling"]'
             )
@@ -126,20 +149,14 @@ class Construction(object):
         self.ext_absorptance = self.materials_list[0].thermal_absorptance
         self.number_of_layers = len(self.materials_list)
 
-        # Calculation of the U-values [W/(m2 K)] and creation of some arrays
-        self.net_thermal_resistance = 0
-        self.thicknesses = np.zeros(self.number_of_layers)
-        self.conductivities = np.zeros(self.number_of_layers)
-        self.densities = np.zeros(self.number_of_layers)
-        self.spec_heats = np.zeros(self.number_of_layers)
-        self.thermal_resistances = np.zeros(self.number_of_layers)
-        for i, mat in zip(range(self.number_of_layers), self.materials_list):
-            self.net_thermal_resistance += mat.thermal_resistance
-            self.thicknesses[i] = mat.thick
-            self.conductivities[i] = mat.cond
-            self.densities[i] = mat.dens
-            self.spec_heats[i] = mat.spec_heat
-            self.thermal_resistances[i] = mat.thermal_resistance
+        # Calculation of the U-values [W/(m2 K)] and creation of the layers arrays
+        n = self.number_of_layers
+        self.thicknesses = np.fromiter((mat.thick for mat in self.materials_list), float, n)
+        self.conductivities = np.fromiter((mat.cond for mat in self.materials_list), float, n)
+        self.densities = np.fromiter((mat.dens for mat in self.materials_list), float, n)
+        self.spec_heats = np.fromiter((mat.spec_heat for mat in self.materials_list), float, n)
+        self.thermal_resistances = np.fromiter((mat.thermal_resistance for mat in self.materials_list), float, n)
+        self.net_thermal_resistance = float(self.thermal_resistances.sum())
         self.thermal_resistance = self.net_thermal_resistance + self._R_si + self._R_se
 
         self._u_value_net = 1 / self.net_thermal_resistance
@@ -175,27 +192,25 @@ class Construction(object):
         sigma = np.sqrt(sigma_2)
         eps = self.thicknesses / sigma
 
-        # Thermal transfer matrix
+        # Thermal transfer matrix (all the layers at once)
 
+        cosh_eps, sinh_eps = np.cosh(eps), np.sinh(eps)
+        cos_eps, sin_eps = np.cos(eps), np.sin(eps)
         Z = np.zeros((2, 2, self.number_of_layers), complex)
-
-        for i in range(self.number_of_layers):
-            Z[0, 0, i] = np.cosh(eps[i]) * np.cos(eps[i]) + 1j * np.sinh(
-                eps[i]
-            ) * np.sin(eps[i])
-            Z[1, 1, i] = Z[0, 0, i]
-            Z[0, 1, i] = -(sigma[i] / (2 * self.conductivities[i])) * (
-                    np.sinh(eps[i]) * np.cos(eps[i])
-                    + np.cosh(eps[i]) * np.sin(eps[i])
-                    + 1j
-                    * (np.cosh(eps[i]) * np.sin(eps[i]) - np.sinh(eps[i]) * np.cos(eps[i]))
-            )
-            Z[1, 0, i] = -(self.conductivities[i] / sigma[i]) * (
-                    np.sinh(eps[i]) * np.cos(eps[i])
-                    - np.cosh(eps[i]) * np.sin(eps[i])
-                    + 1j
-                    * (np.sinh(eps[i]) * np.cos(eps[i]) + np.cosh(eps[i]) * np.sin(eps[i]))
-            )
+        Z[0, 0] = cosh_eps * cos_eps + 1j * sinh_eps * sin_eps
+        Z[1, 1] = Z[0, 0]
+        Z[0, 1] = -(sigma / (2 * self.conductivities)) * (
+                sinh_eps * cos_eps
+                + cosh_eps * sin_eps
+                + 1j
+                * (cosh_eps * sin_eps - sinh_eps * cos_eps)
+        )
+        Z[1, 0] = -(self.conductivities / sigma) * (
+                sinh_eps * cos_eps
+                - cosh_eps * sin_eps
+                + 1j
+                * (sinh_eps * cos_eps + cosh_eps * sin_eps)
+        )
         Z_si = np.eye(2)
         # Internal surface resistance (convection and radiation, ISO 6946)
         Z_si[0, 1] = -self._R_si
@@ -274,56 +289,25 @@ class Construction(object):
         # T_ra = 5        # days
         # omega_ra = 2*pi./(86400*T_ra)
 
-        Z_t2 = np.zeros((2, 2, self.number_of_layers), complex)
-        Z_t7 = np.zeros((2, 2, self.number_of_layers), complex)
-
-        for i in range(self.number_of_layers):
-
-            r = R[i]
-            c = C[i]
-            """
-            R1 = np.zeros((2,1))
-            R2 = R1
-            C1 = R1
-            C2 = R1 
-            """
-            # r_ah = self.massless[i]
-            Av = np.zeros((2, 2, 2), complex)
-
-            # if r_ah == 0:
-
-            for om in range(2):
-                arg = np.sqrt(0.5 * self.omega_bt[om] * r * c)
-
-                Re_a11 = np.cosh(arg) * np.cos(arg)
-                Im_a11 = np.sinh(arg) * np.sin(arg)
-                Re_a22 = Re_a11
-                Im_a22 = Im_a11
-
-                Re_a12 = (
-                        r
-                        / (2 * arg)
-                        * (np.cosh(arg) * np.sin(arg) + np.sinh(arg) * np.cos(arg))
-                )
-                Im_a12 = (
-                        r
-                        / (2 * arg)
-                        * (np.cosh(arg) * np.sin(arg) - np.sinh(arg) * np.cos(arg))
-                )
-
-                Re_a21 = (
-                        -arg / r * (np.cosh(arg) * np.sin(arg) - np.sinh(arg) * np.cos(arg))
-                )
-                Im_a21 = (
-                        arg / r * (np.cosh(arg) * np.sin(arg) + np.sinh(arg) * np.cos(arg))
-                )
-
-                Av[0, 0, om] = Re_a11 + 1j * Im_a11
-                Av[1, 1, om] = Re_a22 + 1j * Im_a22
-                Av[0, 1, om] = Re_a12 + 1j * Im_a12
-                Av[1, 0, om] = Re_a21 + 1j * Im_a21
-            Z_t2[:, :, i] = Av[:, :, 0]
-            Z_t7[:, :, i] = Av[:, :, 1]
+        # Layers matrices for both periods at once: arrays of shape (2 periods, layers)
+        arg = np.sqrt(0.5 * self.omega_bt[:, np.newaxis] * R * C)
+        cosh_arg, sinh_arg = np.cosh(arg), np.sinh(arg)
+        cos_arg, sin_arg = np.cos(arg), np.sin(arg)
+
+        Re_a11 = cosh_arg * cos_arg
+        Im_a11 = sinh_arg * sin_arg
+        Re_a12 = R / (2 * arg) * (cosh_arg * sin_arg + sinh_arg * cos_arg)
+        Im_a12 = R / (2 * arg) * (cosh_arg * sin_arg - sinh_arg * cos_arg)
+        Re_a21 = -arg / R * (cosh_arg * sin_arg - sinh_arg * cos_arg)
+        Im_a21 = arg / R * (cosh_arg * sin_arg + sinh_arg * cos_arg)
+
+        Av = np.zeros((2, 2, 2, self.number_of_layers), complex)
+        Av[0, 0] = Re_a11 + 1j * Im_a11
+        Av[1, 1] = Av[0, 0]
+        Av[0, 1] = Re_a12 + 1j * Im_a12
+        Av[1, 0] = Re_a21 + 1j * Im_a21
+        Z_t2 = Av[:, :, 0]
+        Z_t7 = Av[:, :, 1]
         self._A1n_t2 = np.zeros((2, 2, 1), complex)
         self._A1n_t7 = np.zeros((2, 2, 1), complex)
         self._A1n_t2 = Z_t2[:, :, -1]
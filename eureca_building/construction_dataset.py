@@ -8,6 +8,11 @@ __license__ = "MIT"
 __version__ = "0.1"
 __maintainer__ = "Enrico Prataviera"
 
+import hashlib
+import json
+import os
+import pickle
+
 import pandas as pd
 
 from eureca_building.construction import Construction
@@ -46,14 +51,37 @@ class ConstructionDataset:
         self.windows_dict = {}
 
     @classmethod
-    def read_excel(cls, file):
+    def read_excel(cls, file, cache=False, engine="openpyxl"):
+        """
+        Creates the ConstructionDataset from the excel file
+
+        Parameters
+        ----------
+        file : str
+            path of the xlsx file
+        cache : bool, optional
+            if True the parsed sheets are stored in a <file>.cache.pkl file next to the xlsx
+            and reused while the xlsx content (sha256) and the engine are unchanged.
+            The key is stored in <file>.cache.json, with the hash of the pickle, which is not
+            loaded if it does not match. This protects against stale or corrupted caches, not
+            against someone who can write next to the xlsx: unpickling can execute arbitrary code,
+            so use the cache only in directories you trust. The default is False.
+        engine : str, optional
+            engine used by pandas.read_excel. "calamine" (requires python-calamine
+            and pandas >= 2.2) is much faster on large files. The default is "openpyxl".
+
+        Returns
+        -------
+        ConstructionDataset
+        """
         dataset = cls()
 
-        data = pd.read_excel(file, sheet_name=None, index_col=0)
+        data = _read_excel_sheets(file, cache=cache, engine=engine)
+
+        # Rows are read as plain dicts: .loc[idx] would build a Series per row
 
         # Windows
-        for win_idx in data["Windows"].index:
-            win = data["Windows"].loc[win_idx]
+        for win_idx, win in zip(data["Windows"].index, data["Windows"].to_dict("records")):
             dataset.windows_dict[win_idx] = SimpleWindow(
                 name=win["name"],
                 u_value=win["U [W/(m²K)]"],
@@ -64,8 +92,7 @@ class ConstructionDataset:
                 shading_coef_ext=win["shading_coef_ext [-]"],
             )
         # Materials
-        for mat_idx in data["Materials"].index:
-            mat = data["Materials"].loc[mat_idx]
+        for mat_idx, mat in zip(data["Materials"].index, data["Materials"].to_dict("records")):
             if mat["Material_type"] == "Opaque":
                 dataset.materials_dict[mat_idx] = Material(
                     name=mat["name"],
@@ -84,10 +111,9 @@ class ConstructionDataset:
                     f"Material {mat['name']}, invalid material type"
                 )
         # Constructions
-        for cons_idx in data["Constructions"].index:
-            cons = data["Constructions"].loc[cons_idx]
+        for cons_idx, cons in zip(data["Constructions"].index, data["Constructions"].to_dict("records")):
             list_of_materials = [
-                dataset.materials_dict[x] for x in cons[3:] if str(x) != "nan"
+                dataset.materials_dict[x] for x in list(cons.values())[3:] if str(x) != "nan"
             ]
 
             dataset.constructions_dict[cons_idx] = Construction(
@@ -96,3 +122,37 @@ class ConstructionDataset:
                 construction_type=cons["type"],
             )
         return dataset
+
+
+def _read_excel_sheets(file, cache=False, engine="openpyxl"):
+    """
+    Internal Function
+
+    Reads all the sheets of the excel file, optionally through a pickle sidecar
+    keyed on the excel file content and on the engine
+    """
+    cache_file = f"{file}.cache.pkl"
+    key_file = f"{file}.cache.json"
+    if cache:
+        with open(file, "rb") as f:
+            key = {"xlsx_sha256": hashlib.sha256(f.read()).hexdigest(), "engine": engine}
+        if os.path.isfile(cache_file) and os.path.isfile(key_file):
+            try:
+                with open(key_file, encoding="utf-8") as f:
+                    stored = json.load(f)
+            except ValueError:
+                stored = {}
+            if stored.get("key") == key:
+                with open(cache_file, "rb") as f:
+                    payload = f.read()
+                # The pickle is loaded only if it is the one written with this key
+                if hashlib.sha256(payload).hexdigest() == stored.get("pickle_sha256"):
+                    return pickle.loads(payload)
+    data = pd.read_excel(file, sheet_name=None, index_col=0, engine=engine)
+    if cache:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(cache_file, "wb") as f:
+            f.write(payload)
+        with open(key_file, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "pickle_sha256": hashlib.sha256(payload).hexdigest()}, f)
+    return data
@@ -25,13 +25,20 @@ class PropertyOutsideBoundaries(Exception):
             lim  ([list]): list with boundaries
         """
 
-        super().__init__(mat, prop, lim, unit, value)
+        # args are not packed: the message is only formatted if displayed
+        super().__init__()
         self.prop = prop
         self.mat = mat
         self.lim = lim
         self.unit = unit
         self.value = value
 
+    def __str__(self):
+        return f"{self.mat}, {self.prop} outside boundaries {self.lim} {self.unit}: {self.value}"
+
+    def __reduce__(self):
+        return type(self), (self.mat, self.prop, self.lim, self.unit, self.value)
+
 
 class MaterialPropertyOutsideBoundaries(PropertyOutsideBoundaries):
     """
@@ -11,15 +11,22 @@ __maintainer__ = "Enrico Prataviera"
 
 import os
 import logging
+import logging.handlers
 
 # Logging file
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.DEBUG)  # or whatever
+# delay=True: the file is opened (and truncated) at the first record, not at import
 handler = logging.FileHandler(
-    os.path.join(".", "logging.log"), "w", "utf-8"
+    os.path.join(".", "logging.log"), "w", "utf-8", delay=True
 )  # or whatever
 formatter = logging.Formatter(
     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )  # or whatever
 handler.setFormatter(formatter)  # Pass handler as a parameter, not assign
-root_logger.addHandler(handler)
+# Records are buffered and written in blocks of 64 (or as soon as an error comes),
+# the buffer is flushed at exit by logging.shutdown
+buffered_handler = logging.handlers.MemoryHandler(
+    64, flushLevel=logging.ERROR, target=handler
+)
+root_logger.addHandler(buffered_handler)
@@ -8,9 +8,19 @@ __license__ = "MIT"
 __version__ = "0.1"
 __maintainer__ = "Enrico Prataviera"
 
+import numpy as np
+
 from eureca_building.exceptions import MaterialPropertyOutsideBoundaries
 from eureca_building.units import units, material_limits
 
+# Limits unpacked once: the setters run for every material created
+_THICK_LO, _THICK_HI = material_limits["thickness"]
+_DENS_LO, _DENS_HI = material_limits["density"]
+_COND_LO, _COND_HI = material_limits["conductivity"]
+_SPEC_HEAT_LO, _SPEC_HEAT_HI = material_limits["specific_heat"]
+_ABSORPTANCE_LO, _ABSORPTANCE_HI = material_limits["absorptance"]
+_RESISTANCE_LO, _RESISTANCE_HI = material_limits["thermal_resistance"]
+
 
 class Material:
     """
@@ -53,6 +63,18 @@ class Material:
     spec_heat: float = 1000.0  # Specific heat [J/kgK]
     dens: float = 1000.0  # Density [kg/m3]
 
+    __slots__ = (
+        "name",
+        "_thick",
+        "_cond",
+        "_spec_heat",
+        "_dens",
+        "_thermal_absorptance",
+        "_capacity",
+        "_thermal_resistance",
+        "_dirty",
+    )
+
     # Just to use the @property decorator and the setter function
     # _name: str = field(init = False, repr = False)
     # _thick: float = field(init = False, repr = False)
@@ -103,7 +125,99 @@ class Material:
         self.cond = cond
         self.spec_heat = spec_heat
         self.thermal_absorptance = thermal_absorptance
-        self.calc_paramas()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        names,
+        thick,
+        cond,
+        spec_heat,
+        dens,
+        thermal_absorptance=0.9,
+    ) -> list:
+        """
+        Create several materials at once, checking the properties with one
+        array comparison per property instead of the per-instance setters
+
+        Parameters
+        ----------
+        names : list of str
+            names
+        thick : array-like or float
+            thicknesses
+        cond : array-like or float
+            conductivities
+        spec_heat : array-like or float
+            specific heats
+        dens : array-like or float
+            densities
+        thermal_absorptance : array-like or float
+            thermal absorptances [-]
+
+        Returns
+        -------
+        list of Material
+
+        Raises
+        -------
+        MaterialPropertyOutsideBoundaries
+            If a material parameter is not allowed, NaN included (first wrong material).
+        TypeError
+            If names is not a sequence of str or a property is not a float.
+        ValueError
+            If a property array has not one value per material.
+        """
+        if isinstance(names, str) or not all(isinstance(name, str) for name in names):
+            raise TypeError(f"Materials, names must be a sequence of str: {names}")
+        names = list(names)
+        n = len(names)
+        checks = (
+            ("thickness", thick, _THICK_LO, _THICK_HI, "thickness", "length"),
+            ("density", dens, _DENS_LO, _DENS_HI, "density", "density"),
+            ("conductivity", cond, _COND_LO, _COND_HI, "conductivity", "conductivity"),
+            ("specific_heat", spec_heat, _SPEC_HEAT_LO, _SPEC_HEAT_HI, "specific_heat", "specific_heat"),
+            ("thermal_absorptance", thermal_absorptance, _ABSORPTANCE_LO, _ABSORPTANCE_HI, "absorptance", "absorptance"),
+        )
+        values = []
+        for prop, value, lo, hi, limit, unit in checks:
+            array = np.asarray(value)
+            if array.dtype.kind not in "biuf":
+                # Same conversion of the setters: None and non numeric strings are not floats
+                try:
+                    array = np.array([float(x) for x in array.ravel()]).reshape(array.shape)
+                except (TypeError, ValueError):
+                    raise TypeError(f"Materials {names}, {prop} is not an array of floats: {value}")
+            if array.ndim > 1 or (array.ndim == 1 and len(array) != n):
+                raise ValueError(
+                    f"Materials {names}, {prop} must be a float or an array with one value per material: {value}"
+                )
+            value = np.broadcast_to(array.astype(float), (n,))
+            # Written as not (...) so that NaN values are outside the boundaries, as in the setters
+            wrong = np.flatnonzero(~((value >= lo) & (value <= hi)))
+            if wrong.size > 0:
+                i = wrong[0]
+                raise MaterialPropertyOutsideBoundaries(
+                    names[i],
+                    prop,
+                    lim=material_limits[limit],
+                    unit=units[unit],
+                    value=float(value[i]),
+                )
+            values.append(value.tolist())
+
+        materials = []
+        for name, t, d, c, sh, a in zip(names, *values):
+            mat = cls.__new__(cls)
+            mat.name = name
+            mat._thick = t
+            mat._dens = d
+            mat._cond = c
+            mat._spec_heat = sh
+            mat._thermal_absorptance = a
+            mat._dirty = True
+            materials.append(mat)
+        return materials
 
     @property
     def thick(self) -> float:
@@ -111,14 +225,12 @@ class Material:
 
     @thick.setter
     def thick(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(f"Material {self.name}, thickness is not a float: {value}")
-        if (
-            value < material_limits["thickness"][0]
-            or value > material_limits["thickness"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(f"Material {self.name}, thickness is not a float: {value}")
+        if not (_THICK_LO <= value <= _THICK_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -129,6 +241,7 @@ class Material:
                 value=value,
             )
         self._thick = value
+        self._dirty = True
 
     @property
     def dens(self) -> float:
@@ -136,14 +249,12 @@ class Material:
 
     @dens.setter
     def dens(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(f"Material {self.name}, density is not a float: {value}")
-        if (
-            value < material_limits["density"][0]
-            or value > material_limits["density"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(f"Material {self.name}, density is not a float: {value}")
+        if not (_DENS_LO <= value <= _DENS_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -154,6 +265,7 @@ class Material:
                 value=value,
             )
         self._dens = value
+        self._dirty = True
 
     @property
     def cond(self) -> float:
@@ -161,16 +273,14 @@ class Material:
 
     @cond.setter
     def cond(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, conductivity is not a float: {value}"
-            )
-        if (
-            value < material_limits["conductivity"][0]
-            or value > material_limits["conductivity"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, conductivity is not a float: {value}"
+                )
+        if not (_COND_LO <= value <= _COND_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -181,6 +291,7 @@ class Material:
                 value=value,
             )
         self._cond = value
+        self._dirty = True
 
     @property
     def spec_heat(self) -> float:
@@ -188,16 +299,14 @@ class Material:
 
     @spec_heat.setter
     def spec_heat(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, specific heat is not a float: {value}"
-            )
-        if (
-            value < material_limits["specific_heat"][0]
-            or value > material_limits["specific_heat"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, specific heat is not a float: {value}"
+                )
+        if not (_SPEC_HEAT_LO <= value <= _SPEC_HEAT_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -208,6 +317,7 @@ class Material:
                 value=value,
             )
         self._spec_heat = value
+        self._dirty = True
 
     @property
     def thermal_absorptance(self) -> float:
@@ -215,16 +325,14 @@ class Material:
 
     @thermal_absorptance.setter
     def thermal_absorptance(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, thermal_absorptance is not a float: {value}"
-            )
-        if (
-            value < material_limits["absorptance"][0]
-            or value > material_limits["absorptance"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, thermal_absorptance is not a float: {value}"
+                )
+        if not (_ABSORPTANCE_LO <= value <= _ABSORPTANCE_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -236,15 +344,29 @@ class Material:
             )
         self._thermal_absorptance = value
 
+    @property
+    def capacity(self) -> float:
+        # Computed on first access after any thick/dens/cond/spec_heat change
+        if self._dirty:
+            self.calc_paramas()
+        return self._capacity
+
+    @property
+    def thermal_resistance(self) -> float:
+        if self._dirty:
+            self.calc_paramas()
+        return self._thermal_resistance
+
     def calc_capacity(self):
-        self.capacity = self.thick * self.dens * self.spec_heat
+        self._capacity = self.thick * self.dens * self.spec_heat
 
     def calc_resistance(self):
-        self.thermal_resistance = self.thick / self.cond
+        self._thermal_resistance = self.thick / self.cond
 
     def calc_paramas(self):
         self.calc_capacity()
         self.calc_resistance()
+        self._dirty = False
 
     def __str__(self):
         return f"""
@@ -283,6 +405,15 @@ class AirGapMaterial:
     thick: float = 0.100  # Thickness [m]
     thermal_resistance: float = 1.00  # thermal_resistance [m2K/W]
 
+    __slots__ = (
+        "name",
+        "_thick",
+        "_thermal_resistance",
+        "cond",
+        "dens",
+        "spec_heat",
+    )
+
     # Just to use the @property decorator and the setter function
     # _name: str = field(init = False, repr = False)
     # _thick: float = field(init = False, repr = False)
@@ -328,14 +459,12 @@ class AirGapMaterial:
 
     @thick.setter
     def thick(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(f"Material {self.name}, thickness is not a float: {value}")
-        if (
-            value < material_limits["thickness"][0]
-            or value > material_limits["thickness"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(f"Material {self.name}, thickness is not a float: {value}")
+        if not (_THICK_LO <= value <= _THICK_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -353,16 +482,14 @@ class AirGapMaterial:
 
     @thermal_resistance.setter
     def thermal_resistance(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, thermal_resistance is not a float: {value}"
-            )
-        if (
-            value < material_limits["thermal_resistance"][0]
-            or value > material_limits["thermal_resistance"][1]
-        ):
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, thermal_resistance is not a float: {value}"
+                )
+        if not (_RESISTANCE_LO <= value <= _RESISTANCE_HI):
             # Value in [m]. Take a look to units
             # Check if thickenss is outside
             raise MaterialPropertyOutsideBoundaries(
@@ -8,7 +8,9 @@ __license__ = "MIT"
 __version__ = "0.1"
 __maintainer__ = "Enrico Prataviera"
 
+import functools
 import logging
+import math
 
 import numpy as np
 
@@ -24,10 +26,49 @@ from eureca_building.exceptions import (
 )
 from eureca_building._geometry_auxiliary_functions import (
     check_complanarity,
+    check_complanarity_batch,
     polygon_area,
+    polygons_normal_and_area,
     normal_versor_2,
 )
 
+logger = logging.getLogger(__name__)
+
+# Allowed surface types (frozensets for O(1) membership tests)
+_EXTERNAL_SURFACE_TYPES = frozenset(("ExtWall", "GroundFloor", "Roof"))
+_INTERNAL_SURFACE_TYPES = frozenset(("IntWall", "IntCeiling", "IntFloor"))
+
+# Sky view factor of a vertical surface
+_SKY_VIEW_FACTOR_VERTICAL = (1 + np.cos(np.radians(90))) / 2
+
+# Warnings already logged (logged once, not for every surface)
+_WARNED = set()
+
+
+@functools.lru_cache(maxsize=32)
+def _solar_bins(azimuth_subdivisions, height_subdivisions):
+    """
+    Edges and rounded middle values of the height and azimuth bins used to
+    approximate the surface orientation for the solar radiation calculation.
+    Shared by all the surfaces with the same subdivisions
+
+    Returns
+    -------
+    tuple: height edges, height middle values, sky view factors of the height middle values,
+        azimuth edges, azimuth middle values
+    """
+    delta_a = 360 / (2 * azimuth_subdivisions)
+    delta_h = 90 / (2 * height_subdivisions)
+    h_edges = np.arange(-delta_h, 90 + 2 * delta_h, 2 * delta_h)
+    a_edges = np.arange(-180 - delta_a, 180 + 2 * delta_a, 2 * delta_a)
+    h_edges.setflags(write=False)
+    a_edges.setflags(write=False)
+    h_mids = tuple(int((h_edges[n] + h_edges[n + 1]) / 2) for n in range(len(h_edges) - 1))
+    a_mids = tuple(int((a_edges[n] + a_edges[n + 1]) / 2) for n in range(len(a_edges) - 1))
+    a_mids = tuple(-180 if a == 180 else a for a in a_mids)
+    h_svf = tuple((1 + np.cos(np.radians(h))) / 2 for h in h_mids)
+    return h_edges, h_mids, h_svf, a_edges, a_mids
+
 
 # %% Surface class
 
@@ -45,8 +86,28 @@ class Surface:
         https://stackoverflow.com/questions/12642256/python-find-area-of-polygon-from-xyz-coordinates    
     """
 
-    __warning_azimuth_subdivisions = False
-    __warning_height_subdivisions = False
+    __slots__ = (
+        "name",
+        "__vertices",
+        "_z_max",
+        "_z_min",
+        "__area",
+        "_opaque_area",
+        "_glazed_area",
+        "_normal",
+        "_height",
+        "_azimuth",
+        "__wwr",
+        "_subdivisions_solar_calc",
+        "__azimuth_subdivisions",
+        "__height_subdivisions",
+        "_height_round",
+        "_azimuth_round",
+        "_sky_view_factor",
+        "_surface_type",
+        "_construction",
+        "_window",
+    )
 
     def __init__(
             self,
@@ -119,6 +180,170 @@ class Surface:
 
         self._set_azimuth_and_zenith()
 
+        self._set_optional_properties(wwr, subdivisions_solar_calc, surface_type, construction, window)
+
+    @classmethod
+    def from_arena(
+            cls,
+            name: str,
+            arena: np.ndarray,
+            start: int,
+            count: int,
+            wwr=None,
+            subdivisions_solar_calc=None,
+            surface_type=None,
+            construction=None,
+            window=None
+    ):
+        """
+        Creates a surface whose vertices are the rows [start, start + count) of a
+        preallocated (M, 3) float64 array shared by many surfaces (e.g. filled by a file reader).
+        The surface stores a read-only view of the arena instead of a new array.
+        Ownership: the arena itself stays writable, but area, normal, orientation and heights are
+        calculated when the surface is created. Writing the rows of a surface afterwards leaves it
+        inconsistent: fill the arena first, and call arena.setflags(write=False) once all
+        the surfaces are created to enforce it
+
+        Parameters
+        ----------
+        name : str
+            Name.
+        arena : np.array
+            Vertices coordinates of all the surfaces [m], array (M vertices, 3 coordinates), float64
+        start : int
+            First row of the surface vertices
+        count : int
+            Number of vertices of the surface
+        wwr, subdivisions_solar_calc, surface_type, construction, window
+            Same as Surface.__init__
+
+        Raises
+        ------
+        TypeError
+            If the arena is not a (M, 3) float64 array.
+        ValueError
+            If the rows [start, start + count) are not inside the arena.
+        SurfaceWrongNumberOfVertices
+            If the surface has less than 3 vertices.
+        NonPlanarSurface
+            If the surface is not planar.
+
+        Returns
+        -------
+        Surface
+
+        """
+        if not isinstance(arena, np.ndarray) or arena.dtype != np.float64 or arena.ndim != 2 or arena.shape[1] != 3:
+            raise TypeError(f"Surface {name}, the arena must be a (M, 3) float64 array")
+        if start < 0 or count < 0 or start + count > arena.shape[0]:
+            raise ValueError(
+                f"Surface {name}. Vertices {start} to {start + count} outside the arena: {arena.shape[0]} vertices"
+            )
+        vertices = arena[start:start + count]
+        surface = cls.__new__(cls)
+        surface.name = name
+        surface._set_vertices_array(vertices, vertices)
+        surface._area = polygon_area(surface._vertices)
+        surface._normal = normal_versor_2(surface._vertices)
+        surface._set_azimuth_and_zenith()
+        surface._set_optional_properties(wwr, subdivisions_solar_calc, surface_type, construction, window)
+        return surface
+
+    @classmethod
+    def from_vertex_array(
+            cls,
+            names,
+            vertices,
+            wwr=None,
+            subdivisions_solar_calc=None,
+            surface_type=None,
+            construction=None,
+            window=None
+    ) -> list:
+        """
+        Creates several surfaces with the same number of vertices at once.
+        Areas, normals and complanarity are calculated for all the surfaces
+        with vectorized operations instead of once per surface
+
+        Parameters
+        ----------
+        names : list of str
+            Names.
+        vertices : np.array
+            Vertices coordinates [m], array (N surfaces, V vertices, 3 coordinates)
+        wwr, subdivisions_solar_calc, surface_type, construction, window
+            Same as Surface.__init__, used for all the surfaces
+
+        Raises
+        ------
+        Non3ComponentsVertex
+            If the vertices do not have 3 coordinates.
+        SurfaceWrongNumberOfVertices
+            If the surfaces have less than 3 vertices.
+        NonPlanarSurface
+            If a surface is not planar (first one found).
+
+        Returns
+        -------
+        list of Surface
+
+        """
+        names = list(names)
+        try:
+            # Own copy: the surfaces store read-only views of this array
+            vertices = np.array(vertices, dtype=float)
+        except ValueError:
+            raise ValueError(f"Surfaces {names}. Vertices contain non float values")
+        if vertices.ndim != 3 or vertices.shape[2] != 3:
+            raise Non3ComponentsVertex(
+                f"Surfaces {names}. Vertices must be an array (surfaces, vertices, 3): shape {vertices.shape}"
+            )
+        if vertices.shape[1] < 3:
+            raise SurfaceWrongNumberOfVertices(
+                f"Surfaces {names}. Number of vertices lower than 3: {vertices.shape[1]}"
+            )
+        if vertices.shape[0] != len(names):
+            raise ValueError(
+                f"Surfaces {names}. Number of names and of vertices lists are different: {vertices.shape[0]}"
+            )
+        if not np.isfinite(vertices).all():
+            raise ValueError(f"Surfaces {names}. One vertex contains non finite values")
+        planar = check_complanarity_batch(vertices)
+        if not planar.all():
+            raise NonPlanarSurface(f"Surface {names[np.argmin(planar)]}. Non planar points")
+        normals, areas = polygons_normal_and_area(vertices)
+        # Same zero area replacement of the _area setter, areas are never negative here
+        areas = np.where(areas == 0.0, 1e-10, areas).tolist()
+        vertices.setflags(write=False)
+        z_max = vertices[:, :, 2].max(axis=1).tolist()
+        z_min = vertices[:, :, 2].min(axis=1).tolist()
+
+        surfaces = []
+        for name, vtx, normal, area, z_mx, z_mn in zip(names, vertices, normals, areas, z_max, z_min):
+            surface = cls.__new__(cls)
+            surface.name = name
+            surface.__vertices = vtx
+            surface._z_max = z_mx
+            surface._z_min = z_mn
+            # Glazed and opaque areas are calculated when the wwr is set below
+            surface.__area = area
+            surface._normal = normal
+            surface._set_azimuth_and_zenith()
+            surfaces.append(surface)
+
+        if surface_type is None:
+            # Same thresholds of _set_auto_surface_type, for all the surfaces at once
+            heights = np.array([surface._height for surface in surfaces], dtype=float)
+            surface_types = np.select(
+                [heights < 40, heights > 150], ["Roof", "GroundFloor"], default="ExtWall"
+            ).tolist()
+        else:
+            surface_types = [surface_type] * len(surfaces)
+        for surface, s_type in zip(surfaces, surface_types):
+            surface._set_optional_properties(wwr, subdivisions_solar_calc, s_type, construction, window)
+        return surfaces
+
+    def _set_optional_properties(self, wwr, subdivisions_solar_calc, surface_type, construction, window):
         if wwr is not None:
             self._wwr = wwr
         else:
@@ -138,41 +363,52 @@ class Surface:
             self.window = window
 
     @property
-    def _vertices(self) -> tuple:
+    def _vertices(self) -> np.ndarray:
         return self.__vertices
 
     @_vertices.setter
     def _vertices(self, value: tuple):
+        # A single conversion to an (n, 3) float array validates all the vertices
         try:
-            value = tuple(value)
-        except ValueError:
+            vertices = np.array(value, dtype=float)
+        except TypeError:
             raise TypeError(f"Vertices of surface {self.name} are not a tuple: {value}")
-        if len(value) < 3:  # Not a plane - no area
-            raise SurfaceWrongNumberOfVertices(
-                f"Surface {self.name}. Number of vertices lower than 3: {value}"
-            )
-        for vtx in value:
-            if not isinstance(vtx, tuple):
-                raise TypeError(
-                    f"Vertices of surface {self.name} are not a tuple: {value}"
-                )
-            if len(vtx) != 3:
+        except ValueError:
+            # Either a vertex with a wrong number of components or non float values
+            if any(np.ndim(vtx) != 1 or len(vtx) != 3 for vtx in value):
                 raise Non3ComponentsVertex(
                     f"Surface {self.name} has a vertex with len() != 3: {value}"
                 )
-            try:
-                float(vtx[0])
-                float(vtx[1])
-                float(vtx[2])
-            except ValueError:
-                raise ValueError(
-                    f"Surface {self.name}. One vertex contains non float values: {vtx}"
-                )
-            # Check coplanarity
+            raise ValueError(
+                f"Surface {self.name}. One vertex contains non float values: {value}"
+            )
+        if vertices.ndim == 0:
+            raise TypeError(f"Vertices of surface {self.name} are not a tuple: {value}")
+        self._set_vertices_array(vertices, value)
 
-            if not check_complanarity(value):
-                raise NonPlanarSurface(f"Surface {self.name}. Non planar points")
-        self.__vertices = value
+    def _set_vertices_array(self, vertices: np.ndarray, value):
+        # Checks and stores a float array of vertices, value is the user input for the error messages
+        if len(vertices) < 3:  # Not a plane - no area
+            raise SurfaceWrongNumberOfVertices(
+                f"Surface {self.name}. Number of vertices lower than 3: {value}"
+            )
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise Non3ComponentsVertex(
+                f"Surface {self.name} has a vertex with len() != 3: {value}"
+            )
+        if not np.isfinite(vertices).all():
+            raise ValueError(
+                f"Surface {self.name}. One vertex contains non finite values: {value}"
+            )
+        # Check coplanarity
+        if not check_complanarity(vertices):
+            raise NonPlanarSurface(f"Surface {self.name}. Non planar points")
+        # Stored as a read-only (n, 3) float array, used directly by the geometry functions
+        vertices.setflags(write=False)
+        self.__vertices = vertices
+        # Vertices are not modified afterwards: heights are stored once
+        self._z_max = float(vertices[:, 2].max())
+        self._z_min = float(vertices[:, 2].min())
 
     @property
     def _area(self) -> float:
@@ -192,6 +428,10 @@ class Surface:
             self.__area = 1e-10
         else:
             self.__area = value
+        # Keep glazed and opaque areas consistent if the wwr is already set
+        wwr = getattr(self, "_Surface__wwr", None)
+        if wwr is not None:
+            self._calc_glazed_and_opaque_areas(wwr)
 
     @property
     def _wwr(self) -> float:
@@ -207,6 +447,9 @@ class Surface:
             raise WindowToWallRatioOutsideBoundaries(
                 f"Surface {self.name}, wwrS must included between 0 and 1: {value}"
             )
+        if value == getattr(self, "_Surface__wwr", None):
+            # Same wwr: glazed and opaque areas are already up to date
+            return
         self._calc_glazed_and_opaque_areas(value)
         self.__wwr = value
 
@@ -221,43 +464,46 @@ class Surface:
                 f"Surface {self.name}, subdivisions_solar_calc must be a dict: {value}"
             )
         try:
-            self._azimuth_subdivisions = value["azimuth_subdivisions"]
-        except KeyError:
-            raise KeyError(
-                f"Surface {self.name}, subdivisions_solar_calc must contain an azimuth_subdivisions key: {value}"
-            )
-        try:
-            self._height_subdivisions = value["height_subdivisions"]
-        except KeyError:
+            azimuth_subdivisions = value["azimuth_subdivisions"]
+            height_subdivisions = value["height_subdivisions"]
+        except KeyError as missing:
             raise KeyError(
-                f"Surface {self.name}, subdivisions_solar_calc must contain an height_subdivisions key: {value}"
+                f"Surface {self.name}, subdivisions_solar_calc must contain an {missing.args[0]} key: {value}"
             )
+        # Both values checked before being assigned
+        azimuth_subdivisions = self._check_subdivisions("azimuth_subdivisions", azimuth_subdivisions, 100, 16)
+        height_subdivisions = self._check_subdivisions("height_subdivisions", height_subdivisions, 50, 6)
+        self.__azimuth_subdivisions = azimuth_subdivisions
+        self.__height_subdivisions = height_subdivisions
         self._subdivisions_solar_calc = value
         self._set_azimuth_and_zenith_solar_radiation()
 
-    @property
-    def _azimuth_subdivisions(self) -> int:
-        return self.__azimuth_subdivisions
-
-    @_azimuth_subdivisions.setter
-    def _azimuth_subdivisions(self, value: int):
+    def _check_subdivisions(self, key: str, value: int, max_value: int, high_value: int) -> int:
         try:
             value = int(value)
         except ValueError:
             raise TypeError(
-                f"Surface {self.name}, azimuth_subdivisions is not an int: {value}"
+                f"Surface {self.name}, {key} is not an int: {value}"
             )
-        if value < 1 or value > 100:
+        if value < 1 or value > max_value:
             # Check if unreasonable values provided
             raise ValueError(
-                f"Surface {self.name}, azimuth_subdivisions must be > 1 and lower than 100: {value}"
+                f"Surface {self.name}, {key} must be > 1 and lower than {max_value}: {value}"
             )
-        if value > 16 and not self.__warning_azimuth_subdivisions:
-            logging.warning(
-                f"For one or more surfaces azimuth_subdivisions is high: {value}.\nThe calculation time can be long"
+        if value > high_value and key not in _WARNED:
+            _WARNED.add(key)
+            logger.warning(
+                "For one or more surfaces %s is high: %s.\nThe calculation time can be long", key, value
             )
-            self.__warning_azimuth_subdivisions = True
-        self.__azimuth_subdivisions = value
+        return value
+
+    @property
+    def _azimuth_subdivisions(self) -> int:
+        return self.__azimuth_subdivisions
+
+    @_azimuth_subdivisions.setter
+    def _azimuth_subdivisions(self, value: int):
+        self.__azimuth_subdivisions = self._check_subdivisions("azimuth_subdivisions", value, 100, 16)
 
     @property
     def _height_subdivisions(self) -> int:
@@ -265,23 +511,7 @@ class Surface:
 
     @_height_subdivisions.setter
     def _height_subdivisions(self, value: int):
-        try:
-            value = int(value)
-        except ValueError:
-            raise TypeError(
-                f"Surface {self.name}, height_subdivisions is not an int: {value}"
-            )
-        if value < 1 or value > 50:
-            # Check if unreasonable values provided
-            raise ValueError(
-                f"Surface {self.name}, height_subdivisions must be > 1 and lower than 50: {value}"
-            )
-        if value > 6 and not self.__warning_height_subdivisions:
-            logging.warning(
-                f"For one or more surfaces height_subdivisions is high: {value}.\nThe calculation time can be long"
-            )
-            self.__warning_height_subdivisions = True
-        self.__height_subdivisions = value
+        self.__height_subdivisions = self._check_subdivisions("height_subdivisions", value, 50, 6)
 
     @property
     def surface_type(self):
@@ -291,7 +521,7 @@ class Surface:
     def surface_type(self, value):
         if not isinstance(value, str) and value is not None:
             raise TypeError(f"Surface {self.name}, surface_type is not a str: {value}")
-        if value not in ["ExtWall", "GroundFloor", "Roof"]:
+        if value not in _EXTERNAL_SURFACE_TYPES:
             raise InvalidSurfaceType(
                 f"Surface {self.name}, surface_type must choosen from: [ExtWall, GroundFloor, Roof] {value}"
             )
@@ -320,41 +550,19 @@ class Surface:
     def _set_azimuth_and_zenith(self):
 
         # set the azimuth and zenith
+        # height: angle between the normal and the vertical [0, 180]
+        # azimuth: 0 South, -90 East, 90 West, -180 North, in [-180, 180)
 
-        if self._normal[2] == 1:
-            self._height = 0
-            self._azimuth = 0
-        elif self._normal[2] == -1:
-            self._height = 180
+        nx, ny, nz = self._normal
+        if abs(nz) >= 1.:
+            # Horizontal surface
+            self._height = 0 if nz > 0 else 180
             self._azimuth = 0
         else:
-            self._height = 90 - np.degrees(
-                np.arctan(
-                    (
-                            self._normal[2]
-                            / (np.sqrt(self._normal[0] ** 2 + self._normal[1] ** 2))
-                    )
-                )
-            )
-            if self._normal[1] == 0:
-                if self._normal[0] > 0:
-                    self._azimuth = -90
-                elif self._normal[0] < 0:
-                    self._azimuth = 90
-            else:
-                if self._normal[1] < 0:
-                    self._azimuth = np.degrees(
-                        np.arctan(self._normal[0] / self._normal[1])
-                    )
-                else:
-                    if self._normal[0] < 0:
-                        self._azimuth = 180 + np.degrees(
-                            np.arctan(self._normal[0] / self._normal[1])
-                        )
-                    else:
-                        self._azimuth = -180 + np.degrees(
-                            np.arctan(self._normal[0] / self._normal[1])
-                        )
+            self._height = 90 - math.degrees(math.atan(nz / math.sqrt(nx * nx + ny * ny)))
+            self._azimuth = math.degrees(math.atan2(-nx, -ny))
+            if self._azimuth == 180.:
+                self._azimuth = -180.
 
     def _calc_glazed_and_opaque_areas(self, wwr):
         self._opaque_area = (1 - wwr) * self._area
@@ -363,25 +571,24 @@ class Surface:
     def _set_azimuth_and_zenith_solar_radiation(self):
         # Azimuth and tilt approximation
 
-        delta_a = 360 / (2 * self._azimuth_subdivisions)
-        delta_h = 90 / (2 * self._height_subdivisions)
-        x = np.arange(-delta_h, 90 + 2 * delta_h, 2 * delta_h)
-
-        for n in range(len(x) - 1):
-            if self._height >= x[n] and self._height < x[n + 1]:
-                self._height_round = int((x[n] + x[n + 1]) / 2)
-                self._sky_view_factor = (1 + np.cos(np.radians(self._height_round))) / 2
-            elif self._height >= x[-1] and self._height < 150:
-                self._height_round = 90
-                self._sky_view_factor = (1 + np.cos(np.radians(self._height_round))) / 2
-            else:
-                self._height_round = 0  # Only to avoid errors
-        y = np.arange(-180 - delta_a, 180 + 2 * delta_a, 2 * delta_a)
-        for n in range(len(y) - 1):
-            if self._azimuth >= y[n] and self._azimuth < y[n + 1]:
-                self._azimuth_round = int((y[n] + y[n + 1]) / 2)
-                if self._azimuth_round == 180:
-                    self._azimuth_round = -180
+        h_edges, h_mids, h_svf, a_edges, a_mids = _solar_bins(self._azimuth_subdivisions, self._height_subdivisions)
+
+        # Bin containing the height (-1 or len(h_mids) if outside)
+        # Only the last bin (and heights up to 150) is rounded, other heights get 0
+        # The sky view factor is the one of the bin containing the height
+        h_idx = np.searchsorted(h_edges, self._height, side="right") - 1
+        if 0 <= h_idx < len(h_mids):
+            self._sky_view_factor = h_svf[h_idx]
+        if h_idx == len(h_mids) - 1:
+            self._height_round = h_mids[h_idx]
+        elif self._height >= h_edges[-1] and self._height < 150:
+            self._height_round = 90
+            self._sky_view_factor = _SKY_VIEW_FACTOR_VERTICAL
+        else:
+            self._height_round = 0  # Only to avoid errors
+        a_idx = np.searchsorted(a_edges, self._azimuth, side="right") - 1
+        if 0 <= a_idx < len(a_mids):
+            self._azimuth_round = a_mids[a_idx]
         if self._height_round == 0:
             self._azimuth_round = 0
 
@@ -396,20 +603,16 @@ class Surface:
             self.surface_type = "ExtWall"
 
     def max_height(self):
-        hmax = 0
-        for vert in self.__vertices:
-            hmax = max(hmax, vert[2])
-        return hmax
+        # Not lower than 0
+        return max(0, self._z_max)
 
     def min_height(self):
-        hmin = 10000
-        for vert in self.__vertices:
-            hmin = min(hmin, vert[2])
-        return hmin
+        # Not higher than 10000
+        return min(10000, self._z_min)
 
     def get_VDI6007_surface_params(self, asim=None):
         if asim is None:
-            if self.surface_type in ["ExtWall", "GroundFloor", "Roof"]:
+            if self.surface_type in _EXTERNAL_SURFACE_TYPES:
                 asim = True
             else:
                 asim = False
@@ -500,9 +703,9 @@ class SurfaceInternalMass:
         if not isinstance(value, str) and value is not None:
             raise TypeError(f"SurfaceInternalMass {self.name}, surface_type is not a str: {value}")
         if value == None:
-            logging.warning(f"SurfaceInternalMass {self.name}, surface_type is None: {value}. IntWall will be assigned")
+            logger.warning("SurfaceInternalMass %s, surface_type is None: %s. IntWall will be assigned", self.name, value)
             value = "IntWall"
-        if value not in ["IntWall", "IntCeiling", "IntFloor"]:
+        if value not in _INTERNAL_SURFACE_TYPES:
             raise InvalidSurfaceType(
                 f"SurfaceInternalMass {self.name}, surface_type must choosen from: [IntWall, IntCeiling, IntFloor] {value}"
             )
@@ -527,3 +730,110 @@ class SurfaceInternalMass:
                 f"SurfaceInternalMass {self.name}, construction not specified"
             )
         return R1, C1
+
+
+# %%---------------------------------------------------------------------------------------------------
+# %% SurfaceCollection class
+
+
+class SurfaceCollection:
+    """
+    Struct of arrays snapshot of a list of Surface objects.
+    Areas, normals and orientations of all the surfaces are copied in read-only arrays
+    when the collection is created, so that calculations on all the surfaces (e.g. solar incidence)
+    are vectorized. Later changes of the surfaces (vertices, wwr, ...) are not reflected:
+    create a new SurfaceCollection(collection.surfaces) after modifying them
+
+    Attributes:
+        surfaces: list of Surface
+        names: list of str
+        areas, opaque_areas, glazed_areas: np.array (N) [m2]
+        normals: np.array (N, 3)
+        heights, azimuths: np.array (N) [deg]
+        surface_types: np.array (N) of str
+    """
+
+    def __init__(self, surfaces: list):
+        """
+        Parameters
+        ----------
+        surfaces : list of Surface
+
+        Raises
+        ------
+        TypeError
+            If an element is not a Surface object.
+        """
+        self.surfaces = list(surfaces)
+        for surface in self.surfaces:
+            if not isinstance(surface, Surface):
+                raise TypeError(f"SurfaceCollection, non Surface object in surfaces: {type(surface)}")
+        n = len(self.surfaces)
+        self.names = [surface.name for surface in self.surfaces]
+        self.areas = np.fromiter((surface._area for surface in self.surfaces), float, n)
+        self.opaque_areas = np.fromiter((surface._opaque_area for surface in self.surfaces), float, n)
+        self.glazed_areas = np.fromiter((surface._glazed_area for surface in self.surfaces), float, n)
+        self.normals = np.array([surface._normal for surface in self.surfaces], dtype=float).reshape(n, 3)
+        self.heights = np.fromiter((surface._height for surface in self.surfaces), float, n)
+        self.azimuths = np.fromiter((surface._azimuth for surface in self.surfaces), float, n)
+        self.surface_types = np.array([surface.surface_type for surface in self.surfaces], dtype=str)
+        for array in (
+                self.areas, self.opaque_areas, self.glazed_areas, self.normals,
+                self.heights, self.azimuths, self.surface_types,
+        ):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_vertex_array(cls, names, vertices, **kwargs):
+        """
+        Creates the surfaces with Surface.from_vertex_array and collects them
+
+        Parameters
+        ----------
+        names : list of str
+        vertices : np.array (N surfaces, V vertices, 3 coordinates)
+        **kwargs
+            Other Surface.from_vertex_array arguments
+        """
+        return cls(Surface.from_vertex_array(names, vertices, **kwargs))
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    @staticmethod
+    def sun_direction(zenith, azimuth):
+        """
+        Versors pointing to the sun, same reference system of the surface normals
+
+        Parameters
+        ----------
+        zenith : float or np.array (T)
+            solar zenith [deg]
+        azimuth : float or np.array (T)
+            solar azimuth [deg], 0 South, -90 East (as in WeatherFile hourly_data)
+
+        Returns
+        -------
+        np.array (3) or (T, 3)
+        """
+        zenith = np.radians(zenith)
+        azimuth = np.radians(azimuth)
+        return np.stack(
+            [-np.sin(azimuth) * np.sin(zenith), -np.cos(azimuth) * np.sin(zenith), np.cos(zenith)],
+            axis=-1,
+        )
+
+    def cos_incidence(self, sun_dir):
+        """
+        Cosine of the incidence angle of the sun beam on all the surfaces
+
+        Parameters
+        ----------
+        sun_dir : np.array (3) or (T, 3)
+            versor(s) pointing to the sun
+
+        Returns
+        -------
+        np.array (N) or (N, T)
+        """
+        return self.normals @ np.asarray(sun_dir, dtype=float).T
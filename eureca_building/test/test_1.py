@@ -17,7 +17,7 @@ from eureca_building.material import Material, AirGapMaterial
 from eureca_building.window import SimpleWindow
 from eureca_building.construction import Construction
 from eureca_building.construction_dataset import ConstructionDataset
-from eureca_building.surface import Surface, SurfaceInternalMass
+from eureca_building.surface import Surface, SurfaceInternalMass, SurfaceCollection
 from eureca_building.exceptions import (
     MaterialPropertyOutsideBoundaries,
     MaterialPropertyNotFound,
@@ -50,6 +50,13 @@ class TestMaterials:
         with pytest.raises(MaterialPropertyOutsideBoundaries):
             Material("Test material", cond=1000.0)
 
+    def test_material_with_prop_wrong_message(self):
+        with pytest.raises(MaterialPropertyOutsideBoundaries) as exc_info:
+            Material("Test material", cond=1000.0)
+        assert exc_info.value.prop == "conductivity"
+        assert exc_info.value.value == 1000.0
+        assert "Test material, conductivity" in str(exc_info.value)
+
     def test_material_setter(self):
         # Standard material creation
         mat = Material(
@@ -67,6 +74,43 @@ class TestMaterials:
 
         mat.dens = 800.0
 
+    def test_material_params_after_setter(self):
+        mat = Material(
+            "Test material", thick=0.100, cond=1.00, spec_heat=1000.0, dens=1000.0
+        )
+        assert abs(mat.thermal_resistance - 0.1) < 1e-10
+        assert abs(mat.capacity - 100000.0) < 1e-6
+
+        mat.thick = 0.2
+        assert abs(mat.thermal_resistance - 0.2) < 1e-10
+        assert abs(mat.capacity - 200000.0) < 1e-6
+
+    def test_material_from_arrays(self):
+        mats = Material.from_arrays(
+            ["Mat 1", "Mat 2"], thick=[0.1, 0.2], cond=[1.0, 0.5], spec_heat=1000.0, dens=[1000.0, 500.0]
+        )
+        ref = Material("Mat 2", thick=0.2, cond=0.5, spec_heat=1000.0, dens=500.0)
+        assert mats[1].thermal_resistance == ref.thermal_resistance
+        assert mats[1].capacity == ref.capacity
+        assert mats[0].thermal_absorptance == 0.9
+
+        with pytest.raises(MaterialPropertyOutsideBoundaries):
+            Material.from_arrays(["Mat 1", "Mat 2"], thick=[0.1, 0.2], cond=[1.0, 50.0], spec_heat=1000.0, dens=1000.0)
+        with pytest.raises(TypeError):
+            Material.from_arrays(["Mat 1"], thick=None, cond=1.0, spec_heat=1000.0, dens=1000.0)
+        with pytest.raises(MaterialPropertyOutsideBoundaries):
+            Material.from_arrays(["Mat 1", "Mat 2"], thick=[0.1, np.nan], cond=1.0, spec_heat=1000.0, dens=1000.0)
+        with pytest.raises(MaterialPropertyOutsideBoundaries):
+            Material.from_arrays(["Mat 1", "Mat 2"], thick=0.1, cond=[1.0, np.inf], spec_heat=1000.0, dens=1000.0)
+        with pytest.raises(MaterialPropertyOutsideBoundaries):
+            Material("Mat 1", cond=np.inf)
+        with pytest.raises(MaterialPropertyOutsideBoundaries):
+            Material("Mat 1", thick=np.nan)
+        with pytest.raises(ValueError):
+            Material.from_arrays(["Mat 1", "Mat 2"], thick=[0.1, 0.2, 0.3], cond=1.0, spec_heat=1000.0, dens=1000.0)
+        with pytest.raises(TypeError):
+            Material.from_arrays("ab", thick=0.1, cond=1.0, spec_heat=1000.0, dens=1000.0)
+
     def test_material_setter_list(self):
         # Standard material creation
         mat = Material(
@@ -183,6 +227,44 @@ class TestConstructionDataset:
 
         dataset = ConstructionDataset.read_excel(path)
 
+    def test_read_excel_method_engine(self):
+        path = os.path.join(
+            "eureca_building",
+            "example_scripts",
+            "materials_and_construction_test.xlsx",
+        )
+
+        dataset = ConstructionDataset.read_excel(path, engine="openpyxl")
+        assert dataset.windows_dict[2]._u_value == ConstructionDataset.read_excel(path).windows_dict[2]._u_value
+        with pytest.raises(ValueError):
+            ConstructionDataset.read_excel(path, engine="not_an_engine")
+
+    def test_read_excel_method_cache(self, tmp_path):
+        path = os.path.join(
+            "eureca_building",
+            "example_scripts",
+            "materials_and_construction_test.xlsx",
+        )
+        file = str(tmp_path / "dataset.xlsx")
+        with open(path, "rb") as src, open(file, "wb") as dst:
+            dst.write(src.read())
+
+        dataset = ConstructionDataset.read_excel(file, cache=True)
+        assert os.path.isfile(file + ".cache.pkl")
+        cached = ConstructionDataset.read_excel(file, cache=True)
+        assert cached.constructions_dict.keys() == dataset.constructions_dict.keys()
+        assert cached.windows_dict[2]._u_value == dataset.windows_dict[2]._u_value
+        assert os.path.isfile(file + ".cache.json")
+
+        # A corrupted pickle is not loaded: the sheets are read again from the xlsx
+        with open(file + ".cache.pkl", "wb") as f:
+            f.write(b"not a pickle")
+        reread = ConstructionDataset.read_excel(file, cache=True)
+        assert reread.constructions_dict.keys() == dataset.constructions_dict.keys()
+        # The engine is part of the key: the cache is not used for a different engine
+        with pytest.raises(ValueError):
+            ConstructionDataset.read_excel(file, cache=True, engine="not_an_engine")
+
 
 class TestSurface:
     """
@@ -206,6 +288,26 @@ class TestSurface:
         with pytest.raises(NonPlanarSurface):
             Surface("Surface 1", vertices=((0, 0, 0), (0, 1, 1), (0, 1, 2), (1, 2, 4)))
 
+    def test_coplanar_surface_aligned_vertices(self):
+        # First three vertices aligned: still planar, area and normal from the whole polygon
+        surf = Surface("Surface 1", vertices=((0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 0, 1), (0, 0, 1)))
+        assert surf._area == 2.0
+        assert np.allclose(surf._normal, (0, -1, 0))
+
+    def test_coplanar_surface_precision_boundary(self):
+        # Residual of the plane equation: warp times the area of the first corner parallelogram
+        for side, warp in ((1, 1.0), (10, 0.01)):
+            Surface("Surface 1", vertices=((0, 0, 0), (side, 0, 0), (side, side, 0), (0, side, 0.99 * warp)))
+            with pytest.raises(NonPlanarSurface):
+                Surface("Surface 1", vertices=((0, 0, 0), (side, 0, 0), (side, side, 0), (0, side, 1.01 * warp)))
+
+    def test_coplanar_surface_nearly_aligned_vertices(self):
+        # 1 mm jitter on a mid-edge vertex: planar within the tolerance
+        floor = Surface("Floor", vertices=((0, 0, 0), (5, 0, 0.001), (10, 0, 0), (10, 10, 0), (0, 10, 0)))
+        assert floor._area == pytest.approx(100.0)
+        wall = Surface("Wall", vertices=((0, 0, 0), (5, 0.001, 0), (10, 0, 0), (10, 0, 3), (0, 0, 3)))
+        assert wall._area == pytest.approx(30.0)
+
     def test_wwr_surface(self):
         surf_1 = Surface(
             "Surface 1", vertices=((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)), wwr=0.4,
@@ -232,6 +334,17 @@ class TestSurface:
         assert surf_1._opaque_area == 0.8
         assert surf_1._glazed_area == 0.2
 
+    def test_wwr_surface_area_update(self):
+        surf_1 = Surface(
+            "Surface 1", vertices=((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)), wwr=0.4,
+        )
+
+        surf_1._area = 2.
+        surf_1._wwr = 0.4
+
+        assert surf_1._opaque_area == 1.2
+        assert surf_1._glazed_area == 0.8
+
     def test_subdivision_solar_calc(self):
         surf_1 = Surface(
             "Surface 1",
@@ -307,6 +420,74 @@ class TestSurface:
         with pytest.raises(InvalidSurfaceType):
             surf_1.surface_type = "bds"
 
+    def test_surface_from_vertex_array(self):
+        vertices = (
+            ((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)),
+            ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)),
+        )
+        surfaces = Surface.from_vertex_array(["Surface 1", "Surface 2"], np.array(vertices), wwr=0.4)
+        for surf, vtx in zip(surfaces, vertices):
+            ref = Surface("Surface ref", vertices=vtx, wwr=0.4)
+            assert surf._area == ref._area
+            assert np.array_equal(surf._normal, ref._normal)
+            assert surf.surface_type == ref.surface_type
+            assert surf._glazed_area == ref._glazed_area
+
+        with pytest.raises(NonPlanarSurface):
+            Surface.from_vertex_array(["Surface 1"], [((0, 0, 0), (0, 1, 1), (0, 1, 2), (1, 2, 4))])
+
+    def test_surface_from_vertex_array_nearly_aligned(self):
+        # First three vertices nearly aligned (1 mm): same area and normal for both constructors
+        vertices = ((0, 0, 0), (0.5, 0, 0.001), (1, 0, 0), (1, 0.5, 0), (0, 0.5, 0))
+        surf = Surface.from_vertex_array(["Surface 1"], np.array([vertices]))[0]
+        ref = Surface("Surface ref", vertices=vertices)
+        assert surf._area == ref._area
+        assert ref._area == pytest.approx(0.5)
+        assert np.array_equal(surf._normal, ref._normal)
+
+        with pytest.raises(ValueError):
+            Surface.from_vertex_array(["Surface 1"], [((0, 0, 0), (1, 0, 0), (1, 1, np.nan))])
+
+    def test_surface_from_arena(self):
+        arena = np.array(
+            ((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1), (0, 0, 0), (1, 0, 0), (1, 1, 0)), dtype=float
+        )
+        wall = Surface.from_arena("Surface 1", arena, 0, 4, wwr=0.4)
+        ref = Surface("Surface ref", vertices=((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)), wwr=0.4)
+        assert np.shares_memory(wall._vertices, arena)
+        assert wall._area == ref._area
+        assert wall.surface_type == ref.surface_type
+        assert Surface.from_arena("Surface 2", arena, 4, 3)._vertices.shape == (3, 3)
+
+        assert arena.flags.writeable and not wall._vertices.flags.writeable
+
+        with pytest.raises(ValueError):
+            Surface.from_arena("Surface 3", arena, 5, 3)
+        with pytest.raises(ValueError):
+            Surface.from_arena("Surface 3", arena, -1, 3)
+        with pytest.raises(SurfaceWrongNumberOfVertices):
+            Surface.from_arena("Surface 3", arena, 5, 2)
+
+    def test_surface_collection(self):
+        vertices = np.array((
+            ((0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)),
+            ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)),
+        ))
+        collection = SurfaceCollection.from_vertex_array(["South wall", "Roof"], vertices, wwr=0.2)
+        assert len(collection) == 2
+        assert np.allclose(collection.areas, [1., 1.])
+        assert list(collection.surface_types) == ["ExtWall", "Roof"]
+        # Sun at 45 deg from the South
+        cos_inc = collection.cos_incidence(SurfaceCollection.sun_direction(45., 0.))
+        assert np.allclose(cos_inc, [np.cos(np.pi / 4), np.cos(np.pi / 4)])
+
+        # Snapshot: changes of the surfaces need a new collection
+        collection.surfaces[0]._wwr = 0.5
+        assert np.allclose(collection.glazed_areas, [0.2, 0.2])
+        assert np.allclose(SurfaceCollection(collection.surfaces).glazed_areas, [0.5, 0.2])
+        with pytest.raises(ValueError):
+            collection.areas[0] = 2.
+
     def test_creation_of_surfaceIM_zero(self):
         surf = SurfaceInternalMass("Surface 1")
         print(surf.name)
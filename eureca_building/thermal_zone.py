@@ -12,7 +12,12 @@ import logging
 
 import numpy as np
 
-from eureca_building.surface import Surface, SurfaceInternalMass
+from eureca_building.surface import (
+    Surface,
+    SurfaceInternalMass,
+    _EXTERNAL_SURFACE_TYPES,
+    _INTERNAL_SURFACE_TYPES,
+)
 from eureca_building.fluids_properties import air_properties
 from eureca_building._VDI6007_auxiliary_functions import impedence_parallel, tri2star
 from eureca_building.exceptions import (
@@ -24,6 +29,9 @@ from eureca_building.exceptions import (
     NegativeSurfaceArea,
 )
 
+# Volumetric heat capacity of air [J/(m3 K)], constant for every zone
+_AIR_VOLUMETRIC_HEAT_CAPACITY = air_properties["density"] * air_properties["specific_heat"]
+
 
 # %% ThermalZone class
 
@@ -116,7 +124,7 @@ class ThermalZone(object):
             self.__volume = 1e-5
         else:
             self.__volume = abs(value)
-        self._air_thermal_capacity = self.__volume * air_properties["density"] * air_properties["specific_heat"]
+        self._air_thermal_capacity = self.__volume * _AIR_VOLUMETRIC_HEAT_CAPACITY
 
     @property
     def _air_thermal_capacity(self) -> float:
@@ -172,7 +180,7 @@ class ThermalZone(object):
                     self.DenAm += surface._opaque_area * surface.construction.k_int ** 2
                 self.Atot += surface._area
 
-                if surface.surface_type in ["ExtWall", "GroundFloor", "Roof"]:
+                if surface.surface_type in _EXTERNAL_SURFACE_TYPES:
                     self.Htr_op += surface._opaque_area * surface.construction._u_value
                     if surface._glazed_area > 0.:
                         self.Htr_w += surface._glazed_area * surface.window._u_value
@@ -231,7 +239,7 @@ class ThermalZone(object):
         # Cycling surface to calculates the Resistance and capacitance of the vdi 6007
 
         for surface in self._surface_list:
-            if surface.surface_type in ["ExtWall", "GroundFloor", "Roof"]:
+            if surface.surface_type in _EXTERNAL_SURFACE_TYPES:
                 surface_R1, surface_C1 = surface.get_VDI6007_surface_params(asim=True)
                 C1AW_v = np.append(C1AW_v, [surface_C1], axis=0)
                 # Opaque params
@@ -262,7 +270,7 @@ class ThermalZone(object):
                 AreaAW = np.append(AreaAW, surface._opaque_area)
                 AreaAF = np.append(AreaAF, surface._glazed_area)
 
-            elif surface.surface_type in ["IntWall", "IntCeiling", "IntFloor"]:
+            elif surface.surface_type in _INTERNAL_SURFACE_TYPES:
                 surface_R1, surface_C1 = surface.get_VDI6007_surface_params(asim=True)
                 R1IW_m = np.append(R1IW_m, [surface_R1], axis=0)
                 C1IW_m = np.append(C1IW_m, [surface_C1], axis=0)
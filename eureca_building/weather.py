@@ -112,15 +112,16 @@ class WeatherFile():
         self.general_data['azimuth_subdivisions'] = azimuth_subdivisions
         self.general_data['height_subdivisions'] = height_subdivisions
 
-        # Check some weather data values
-        if not np.all(np.greater(self.hourly_data["out_air_db_temperature"], -50.)) or not np.all(
-                np.less(self.hourly_data["out_air_db_temperature"], 60.)):
+        # Check some weather data values (min/max reductions, no temporary boolean arrays)
+        # Written as not (...) so that NaN values still raise the warning
+        t_db = self.hourly_data["out_air_db_temperature"]
+        if not (t_db.min() > -50. and t_db.max() < 60.):
             logging.warning(f"WeatherFile class, input drybulb outdoor temperature is out of range [-50:60] °C")
-        if not np.all(np.greater(self.hourly_data["wind_speed"], -0.001)) or not np.all(
-                np.less(self.hourly_data["wind_speed"], 25.001)):
+        wind = self.hourly_data["wind_speed"]
+        if not (wind.min() > -0.001 and wind.max() < 25.001):
             logging.warning(f"WeatherFile, input wind speed is out of range [-0.001, 25.] m/s")
-        if not np.all(np.greater(self.hourly_data["out_air_relative_humidity"], -0.0001)) or not np.all(
-                np.less(self.hourly_data["out_air_relative_humidity"], 1.)):
+        rh = self.hourly_data["out_air_relative_humidity"]
+        if not (rh.min() > -0.0001 and rh.max() < 1.):
             logging.warning(f"WeatherFile, input relative humidity is out of range [-0.001, 1] [-]")
 
         if irradiances_calculation:
@@ -141,6 +142,10 @@ class WeatherFile():
         self.hourly_data["solar_position_elevation"] = self._solar_position['elevation'].values
         self.hourly_data["solar_position_azimuth"] = self._solar_position['azimuth'].values - 180.
         self.hourly_data["solar_position_equation_of_time"] = self._solar_position['equation_of_time'].values
+        # Extraterrestrial radiation and airmass do not depend on the direction: calculated once
+        self._dni_extra = pvlib.irradiance.get_extra_radiation(self.hourly_data["time_index"], solar_constant=1366.1,
+                                                               method='spencer')
+        self._airmass = self._site.get_airmass(solar_position=self._solar_position)
 
         # Dataframe with hourly solar radiation per each direction
         azimuth_array = np.linspace(-180, 180, self.general_data['azimuth_subdivisions'] + 1)[:-1]
@@ -182,23 +187,18 @@ def _TskyCalc(T_ext, T_dp, P_, n_opaque, time_steps):
     # Calculation Martin Berdhal model used by TRNSYS
 
     day = np.arange(24 * time_steps)  # Inizialization day vector
-    T_sky = np.zeros(24 * time_steps)
-    Tsky = []
-    T_sky_year = []
-    for i in range(365):
-        for x in day:
-            t = i * 24 + x
-            Tdp = T_dp[t]
-            P = P_[t] / 100  # [mbar]
-            nopaque = n_opaque[t] * 0.1  # [0-1]
-            eps_m = 0.711 + 0.56 * Tdp / 100 + 0.73 * (Tdp / 100) ** 2
-            eps_h = 0.013 * np.cos(2 * np.pi * (x + 1) / 24)
-            eps_e = 0.00012 * (P - 1000)
-            eps_clear = eps_m + eps_h + eps_e  # Emissivity under clear sky condition
-            C = nopaque * 0.9  # Infrared cloud amount
-            eps_sky = eps_clear + (1 - eps_clear) * C  # Sky emissivity
-            T_sky[x] = ((T_ext[t] + 273) * (eps_sky ** 0.25)) - 273  # Apparent sky temperature [°C]
-        Tsky = np.append(Tsky, T_sky)  # Annual Tsky created day by day
+    # Indexes of the weather arrays for each step of the year, day by day
+    t = (np.arange(365)[:, np.newaxis] * 24 + day).ravel()
+    Tdp = T_dp[t]
+    P = P_[t] / 100  # [mbar]
+    nopaque = n_opaque[t] * 0.1  # [0-1]
+    eps_m = 0.711 + 0.56 * Tdp / 100 + 0.73 * (Tdp / 100) ** 2
+    eps_h = np.tile(0.013 * np.cos(2 * np.pi * (day + 1) / 24), 365)  # Same daily profile
+    eps_e = 0.00012 * (P - 1000)
+    eps_clear = eps_m + eps_h + eps_e  # Emissivity under clear sky condition
+    C = nopaque * 0.9  # Infrared cloud amount
+    eps_sky = eps_clear + (1 - eps_clear) * C  # Sky emissivity
+    Tsky = ((T_ext[t] + 273) * (eps_sky ** 0.25)) - 273  # Annual apparent sky temperature [°C]
 
     # Average temperature difference between External air temperature and Apparent sky temperature
     dT_er = np.mean(T_ext - Tsky[:-time_steps + 1])
@@ -234,8 +234,7 @@ def _get_irradiance(weather_obj, surf_tilt, surf_az):
     POA_irradiance = pvlib.irradiance.get_total_irradiance(
         surface_tilt=surf_tilt,
         surface_azimuth=surf_az,
-        dni_extra=pvlib.irradiance.get_extra_radiation(weather_obj.hourly_data["time_index"], solar_constant=1366.1,
-                                                       method='spencer'),
+        dni_extra=weather_obj._dni_extra,
         dni=weather_obj._epw_hourly_data['dni'],
         ghi=weather_obj._epw_hourly_data['ghi'],
         dhi=weather_obj._epw_hourly_data['dhi'],
@@ -243,7 +242,7 @@ def _get_irradiance(weather_obj, surf_tilt, surf_az):
         solar_azimuth=weather_obj.hourly_data["solar_position_azimuth"],
         model='isotropic',
         model_perez='allsitescomposite1990',
-        airmass=weather_obj._site.get_airmass(solar_position=weather_obj._solar_position))
+        airmass=weather_obj._airmass)
     AOI = pvlib.irradiance.aoi(
         surface_tilt=surf_tilt,
         surface_azimuth=surf_az,
@@ -252,9 +251,11 @@ def _get_irradiance(weather_obj, surf_tilt, surf_az):
 
     # Cleaning AOI vector
 
-    for i in range(len(AOI)):
-        if AOI[i] > 90 or weather_obj.hourly_data["solar_position_apparent_zenith"][i] > 90:
-            AOI[i] = 90
+    AOI = np.where(
+        (np.asarray(AOI) > 90) | (weather_obj.hourly_data["solar_position_apparent_zenith"] > 90),
+        90.,
+        AOI,
+    )
 
     return pd.DataFrame({'GHI': weather_obj._epw_hourly_data['ghi'],
                          'POA': POA_irradiance['poa_global'],
@@ -35,6 +35,45 @@ class SimpleWindow(object):
         simpleGlazingModel
     """
 
+    __slots__ = (
+        "name",
+        "_u_value",
+        "_solar_heat_gain_coef",
+        "_visible_transmittance",
+        "_frame_factor",
+        "_shading_coef_int",
+        "_shading_coef_ext",
+        # simpleGlazingModel results
+        "Ri_w",
+        "Ro_w",
+        "Rl_w",
+        "d",
+        "Keff",
+        "Ts",
+        "Ts_1",
+        "Ts_2",
+        "x",
+        "Ri_s",
+        "Ri_s_1",
+        "Ri_s_2",
+        "Ro_s",
+        "Ro_s_1",
+        "Ro_s_2",
+        "Rl",
+        "N",
+        "As",
+        "Rs_f",
+        "Rs_b",
+        "Rv_f",
+        "Rv_b",
+        "alpha2",
+        "Rs_abs_alpha",
+        "Ts_abs_alpha",
+        "As_abs_alpha",
+        "solar_heat_gain_coef_abs_alpha",
+        "solar_heat_gain_coef_profile",
+    )
+
     def __init__(
         self,
         name: str,
@@ -88,10 +127,11 @@ class SimpleWindow(object):
 
     @u_value.setter
     def u_value(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(f"Material {self.name}, u_value is not a float: {value}")
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(f"Material {self.name}, u_value is not a float: {value}")
         if (
             value < window_material_limits["window_u_value"][0]
             or value > window_material_limits["window_u_value"][1]
@@ -113,12 +153,13 @@ class SimpleWindow(object):
 
     @solar_heat_gain_coef.setter
     def solar_heat_gain_coef(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, solar_heat_gain_coef is not a float: {value}"
-            )
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, solar_heat_gain_coef is not a float: {value}"
+                )
         if (
             value < window_material_limits["solar_heat_gain_coefficient"][0]
             or value > window_material_limits["solar_heat_gain_coefficient"][1]
@@ -140,12 +181,13 @@ class SimpleWindow(object):
 
     @visible_transmittance.setter
     def visible_transmittance(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, visible_transmittance is not a float: {value}"
-            )
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, visible_transmittance is not a float: {value}"
+                )
         if (
             value < window_material_limits["non_dimensional_coefficient"][0]
             or value > window_material_limits["non_dimensional_coefficient"][1]
@@ -167,12 +209,13 @@ class SimpleWindow(object):
 
     @frame_factor.setter
     def frame_factor(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, frame_factor is not a float: {value}"
-            )
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, frame_factor is not a float: {value}"
+                )
         if (
             value < window_material_limits["non_dimensional_coefficient"][0]
             or value > window_material_limits["non_dimensional_coefficient"][1]
@@ -194,12 +237,13 @@ class SimpleWindow(object):
 
     @shading_coef_int.setter
     def shading_coef_int(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, shading_coef_int is not a float: {value}"
-            )
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, shading_coef_int is not a float: {value}"
+                )
         if (
             value < window_material_limits["non_dimensional_coefficient"][0]
             or value > window_material_limits["non_dimensional_coefficient"][1]
@@ -221,12 +265,13 @@ class SimpleWindow(object):
 
     @shading_coef_ext.setter
     def shading_coef_ext(self, value: float):
-        try:
-            value = float(value)
-        except ValueError:
-            raise TypeError(
-                f"Material {self.name}, shading_coef_ext is not a float: {value}"
-            )
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"Material {self.name}, shading_coef_ext is not a float: {value}"
+                )
         if (
             value < window_material_limits["non_dimensional_coefficient"][0]
             or value > window_material_limits["non_dimensional_coefficient"][1]